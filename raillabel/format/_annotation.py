@@ -16,6 +16,16 @@ class _Annotation(ABC):
     attributes: t.Dict[str, t.Union[int, float, bool, str, list]] = field(default_factory=dict)
     sensor: Sensor = None
 
+    # Maps the python types of the attribute values to the OpenLABEL attribute types
+    _ATTRIBUTE_TYPES: t.ClassVar[t.Dict[type, str]] = {
+        str: "text",
+        float: "num",
+        int: "num",
+        bool: "boolean",
+        list: "vec",
+        tuple: "vec",
+    }
+
     @property
     @abstractproperty
     def _REQ_FIELDS(self) -> t.List[str]:
@@ -77,7 +87,7 @@ class _Annotation(ABC):
         if self.sensor is not None:
             dict_repr["coordinate_system"] = str(self.sensor.uid)
 
-        if self.attributes != {}:
+        if self.attributes:
             dict_repr["attributes"] = {}
 
             for attr_name, attr_value in self.attributes.items():
@@ -86,28 +96,18 @@ class _Annotation(ABC):
                 # dictionary, they must be seperated by type in order to comply
                 # with the OpenLabel format.
 
-                if type(attr_value) == str:
-                    attr_type = "text"
-
-                elif type(attr_value) in [float, int]:
-                    attr_type = "num"
-
-                elif type(attr_value) == bool:
-                    attr_type = "boolean"
+                try:
+                    attr_type = self._ATTRIBUTE_TYPES[type(attr_value)]
 
-                elif type(attr_value) in [list, tuple]:
-                    attr_type = "vec"
-
-                else:
+                except KeyError:
                     raise TypeError(
                         f"Attribute type {attr_value.__class__.__name__} of {attr_value} is not "
                         + "supported. Supported types are str, float, int, bool, list, tuple."
-                    )
-
-                if attr_type not in dict_repr["attributes"]:
-                    dict_repr["attributes"][attr_type] = []
+                    ) from None
 
-                dict_repr["attributes"][attr_type].append({"name": attr_name, "val": attr_value})
+                dict_repr["attributes"].setdefault(attr_type, []).append(
+                    {"name": attr_name, "val": attr_value}
+                )
 
         return dict_repr
 
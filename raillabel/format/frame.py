@@ -4,7 +4,7 @@
 import decimal
 import typing as t
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 from .num import Num
 from .object_data import ObjectData
@@ -44,6 +44,9 @@ class Frame:
     data: t.Dict[str, Num] = field(default_factory=dict)
     object_data: t.Dict[uuid.UUID, ObjectData] = field(default_factory=dict)
 
+    # Names of the fields compared by __eq__ after the uid. Set below the class definition.
+    _COMPARED_FIELDS: t.ClassVar[t.Tuple[str, ...]] = ()
+
     @property
     def annotations(self) -> t.Dict[uuid.UUID, t.Any]:
         """Return dict containing all annotations of this frame.
@@ -72,44 +75,49 @@ class Frame:
 
         dict_repr = {}
 
-        if self.timestamp is not None or self.sensors != {}:
-            dict_repr["frame_properties"] = {}
+        frame_properties: t.Dict[str, t.Any] = {}
+
+        sensors = self.sensors
+        data = self.data
+        object_data = self.object_data
 
         if self.timestamp is not None:
-            dict_repr["frame_properties"]["timestamp"] = str(self.timestamp)
+            frame_properties["timestamp"] = str(self.timestamp)
+
+        if sensors:
+            frame_properties["streams"] = {str(k): v.asdict() for k, v in sensors.items()}
 
-        if self.sensors != {}:
-            dict_repr["frame_properties"]["streams"] = {
-                str(k): v.asdict() for k, v in self.sensors.items()
-            }
+        if data:
+            frame_properties["frame_data"] = {"num": [v.asdict() for v in data.values()]}
 
-        if self.data != {}:
-            dict_repr["frame_properties"]["frame_data"] = {
-                "num": [v.asdict() for v in self.data.values()]
-            }
+        if frame_properties:
+            dict_repr["frame_properties"] = frame_properties
 
-        if self.object_data != {}:
-            dict_repr["objects"] = {str(k): v.asdict() for k, v in self.object_data.items()}
+        if object_data:
+            dict_repr["objects"] = {str(k): v.asdict() for k, v in object_data.items()}
 
         return dict_repr
 
+    # === Special Methods ====================================================
+
     def __eq__(self, other) -> bool:
-        """Handel equal comparisons."""
+        """Handle equal comparisons.
 
-        if not hasattr(other, "__dict__"):
-            return False
+        The uid is compared first, since it differs between frames of the same scene. All other
+        dataclass fields with compare=True are compared afterwards.
+        """
+
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-        if len(self.__dict__) != len(other.__dict__):
+        if self.uid != other.uid:
             return False
 
-        for attr in self.__dict__:
+        for name in self._COMPARED_FIELDS:
+            if getattr(self, name) != getattr(other, name):
+                return False
 
-            if type(getattr(self, attr)) == type(self):
-                if getattr(self, attr).uid != getattr(other, attr).uid:
-                    return False
+        return True
 
-            else:
-                if getattr(self, attr) != getattr(other, attr):
-                    return False
 
-        return True
+Frame._COMPARED_FIELDS = tuple(f.name for f in fields(Frame) if f.compare and f.name != "uid")
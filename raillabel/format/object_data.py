@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from ._annotation import _Annotation
 from .bbox import Bbox
 from .cuboid import Cuboid
+from .num import Num
 from .object import Object
 from .poly2d import Poly2d
 from .poly3d import Poly3d
@@ -39,7 +40,17 @@ class ObjectData:
     """
 
     object: Object
-    annotations: t.Dict[str, t.Type[_Annotation]] = field(default_factory=dict)
+    annotations: t.Dict[str, _Annotation] = field(default_factory=dict)
+
+    # Maps the annotation classes to their OpenLABEL types in the order of the dict representation
+    _OPENLABEL_TYPES: t.ClassVar[t.Dict[type, str]] = {
+        Bbox: "bbox",
+        Poly2d: "poly2d",
+        Poly3d: "poly3d",
+        Cuboid: "cuboid",
+        Seg3d: "vec",
+        Num: "num",
+    }
 
     @property
     def bboxs(self) -> t.Dict[str, Bbox]:
@@ -57,7 +68,7 @@ class ObjectData:
         return {k: v for k, v in self.annotations.items() if isinstance(v, Poly2d)}
 
     @property
-    def poly3ds(self) -> t.Dict[str, Bbox]:
+    def poly3ds(self) -> t.Dict[str, Poly3d]:
         """Return dictionary of all 3d poly lines."""
         return {k: v for k, v in self.annotations.items() if isinstance(v, Poly3d)}
 
@@ -78,41 +89,34 @@ class ObjectData:
         ------
         ValueError
             if an attribute can not be converted to the type required by the OpenLabel schema.
+        TypeError
+            if an annotation is not an instance of a supported annotation class.
         """
 
-        dict_repr = {"object_data": {}}
+        # The annotations are sorted into the lists of their OpenLABEL types in a single pass.
+        annotations_by_type: t.Dict[str, t.List[dict]] = {
+            ol_type: [] for ol_type in self._OPENLABEL_TYPES.values()
+        }
+        for annotation in self.annotations.values():
+            annotations_by_type[self._openlabel_type(annotation)].append(annotation.asdict())
 
-        if self.bboxs != {}:
-            dict_repr["object_data"]["bbox"] = []
+        return {"object_data": {k: v for k, v in annotations_by_type.items() if v}}
 
-            for bbox in self.bboxs.values():
-                dict_repr["object_data"]["bbox"].append(bbox.asdict())
+    # === Private Methods ====================================================
 
-        if self.poly2ds != {}:
-            dict_repr["object_data"]["poly2d"] = []
+    def _openlabel_type(self, annotation: _Annotation) -> str:
+        """Return the OpenLABEL type of an annotation. Subclasses resolve to their base type."""
 
-            for poly2d in self.poly2ds.values():
-                dict_repr["object_data"]["poly2d"].append(poly2d.asdict())
+        for cls in type(annotation).__mro__:
+            if cls in self._OPENLABEL_TYPES:
+                return self._OPENLABEL_TYPES[cls]
 
-        if self.poly3ds != {}:
-            dict_repr["object_data"]["poly3d"] = []
-
-            for poly3d in self.poly3ds.values():
-                dict_repr["object_data"]["poly3d"].append(poly3d.asdict())
-
-        if self.cuboids != {}:
-            dict_repr["object_data"]["cuboid"] = []
-
-            for cuboid in self.cuboids.values():
-                dict_repr["object_data"]["cuboid"].append(cuboid.asdict())
-
-        if self.seg3ds != {}:
-            dict_repr["object_data"]["vec"] = []
-
-            for seg3d in self.seg3ds.values():
-                dict_repr["object_data"]["vec"].append(seg3d.asdict())
-
-        return dict_repr
+        raise TypeError(
+            f"Annotation type {annotation.__class__.__name__} of {annotation.uid} is not "
+            + "supported. Supported types are "
+            + ", ".join(cls.__name__ for cls in self._OPENLABEL_TYPES)
+            + "."
+        )
 
 
 class AnnotationContainer(dict):
@@ -16,6 +16,8 @@ class Point2d:
         The y-coordinate of the point in the image.
     """
 
+    __slots__ = ("x", "y")
+
     x: float
     y: float
 
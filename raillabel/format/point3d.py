@@ -18,6 +18,8 @@ class Point3d:
         The z-coordinate of the point.
     """
 
+    __slots__ = ("x", "y", "z")
+
     x: float
     y: float
     z: float
@@ -64,20 +64,31 @@ class Poly2d(_Annotation):
             Converted annotation.
         warnings: list of str
             List of non-critical errors, that have occurred during the conversion.
+
+        Raises
+        ------
+        ValueError
+            if the number of values in val is not a multiple of 2.
         """
 
         warnings = []  # list of warnings, that have occurred during the parsing
 
-        # Parses the points
-        points = []
-        for i in range(0, len(data_dict["val"]), 2):
-            points.append(Point2d(x=data_dict["val"][i], y=data_dict["val"][i + 1]))
+        val = data_dict["val"]
+        if len(val) % 2 != 0:
+            raise ValueError(
+                f"The val of the annotation {data_dict['uid']} has {len(val)} values, which can "
+                + "not be paired up to 2d points."
+            )
+
+        # Parses the points by pairing up consecutive coordinates of the flat value list
+        coordinates = iter(val)
+        points = [Point2d(x, y) for x, y in zip(coordinates, coordinates)]
 
         # Creates the annotation with all mandatory properties
         annotation = Poly2d(
             uid=str(data_dict["uid"]),
             name=str(data_dict["name"]),
-            closed=data_dict["closed"],
+            closed=bool(data_dict["closed"]),
             mode=data_dict["mode"],
             points=points,
         )
@@ -117,11 +128,9 @@ class Poly2d(_Annotation):
 
         dict_repr = self._annotation_required_fields_asdict()
 
-        dict_repr["closed"] = bool(self.closed)
-        dict_repr["val"] = []
+        dict_repr["closed"] = self.closed
+        dict_repr["val"] = [float(c) for point in self.points for c in (point.x, point.y)]
         dict_repr["mode"] = self.mode
-        for point in self.points:
-            dict_repr["val"].extend(point.asdict())
 
         dict_repr.update(self._annotation_optional_fields_asdict())
 
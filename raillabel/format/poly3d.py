@@ -56,41 +56,54 @@ class Poly3d(_Annotation):
             Converted annotation.
         warnings: list of str
             List of non-critical errors, that have occurred during the conversion.
+
+        Raises
+        ------
+        ValueError
+            if the number of values in val is not a multiple of 3.
         """
 
         warnings = []  # list of warnings, that have occurred during the parsing
 
-        # Parses the points
-        points = []
-        for i in range(0, len(data_dict["val"]), 3):
-            points.append(
-                Point3d(x=data_dict["val"][i], y=data_dict["val"][i + 1], z=data_dict["val"][i + 2])
+        uid = data_dict["uid"]
+        coordinate_system = data_dict.get("coordinate_system", "")
+
+        val = data_dict["val"]
+        if len(val) % 3 != 0:
+            raise ValueError(
+                f"The val of the annotation {uid} has {len(val)} values, which can not be "
+                + "grouped into 3d points."
             )
 
+        # Parses the points by grouping consecutive coordinates of the flat value list
+        coordinates = iter(val)
+        points = [Point3d(x, y, z) for x, y, z in zip(coordinates, coordinates, coordinates)]
+
         # Creates the annotation with all mandatory properties
         annotation = Poly3d(
-            uid=str(data_dict["uid"]),
+            uid=str(uid),
             name=str(data_dict["name"]),
-            closed=data_dict["closed"],
+            closed=bool(data_dict["closed"]),
             points=points,
         )
 
         # Adds the optional properties
-        if "coordinate_system" in data_dict and data_dict["coordinate_system"] != "":
+        if coordinate_system != "":
             try:
-                annotation.sensor = sensors[data_dict["coordinate_system"]]
+                annotation.sensor = sensors[coordinate_system]
 
             except KeyError:
                 warnings.append(
-                    f"{data_dict['coordinate_system']} does not exist as a coordinate system, "
-                    + f"but is referenced for the annotation {data_dict['uid']}."
+                    f"{coordinate_system} does not exist as a coordinate system, "
+                    + f"but is referenced for the annotation {uid}."
                 )
 
         # Adds the attributes
         if "attributes" in data_dict:
-            annotation.attributes = {
-                a["name"]: a["val"] for l in data_dict["attributes"].values() for a in l
-            }
+            attributes = annotation.attributes
+            for attributes_of_type in data_dict["attributes"].values():
+                for attribute in attributes_of_type:
+                    attributes[attribute["name"]] = attribute["val"]
 
         return annotation, warnings
 
@@ -110,10 +123,8 @@ class Poly3d(_Annotation):
 
         dict_repr = self._annotation_required_fields_asdict()
 
-        dict_repr["closed"] = bool(self.closed)
-        dict_repr["val"] = []
-        for point in self.points:
-            dict_repr["val"].extend(point.asdict())
+        dict_repr["closed"] = self.closed
+        dict_repr["val"] = [float(c) for point in self.points for c in (point.x, point.y, point.z)]
 
         dict_repr.update(self._annotation_optional_fields_asdict())
 
@@ -28,6 +28,26 @@ def test_post_init():
         )
 
 
+def test_attributes_asdict():
+    num = raillabel.format.Num(
+        uid="78f0ad89-2750-4a30-9d66-44c9da73a714",
+        name="test_name",
+        val=1,
+        attributes={"text_attr": "a", "num_attr": 2, "bool_attr": True, "vec_attr": [1, 2]},
+    )
+
+    assert num.asdict()["attributes"] == {
+        "text": [{"name": "text_attr", "val": "a"}],
+        "num": [{"name": "num_attr", "val": 2}],
+        "boolean": [{"name": "bool_attr", "val": True}],
+        "vec": [{"name": "vec_attr", "val": [1, 2]}],
+    }
+
+    num.attributes["dict_attr"] = {}
+    with pytest.raises(TypeError):
+        num.asdict()
+
+
 # Executes the test if the file is called
 if __name__ == "__main__":
     os.system("clear")
@@ -0,0 +1,127 @@
+# Copyright DB Netz AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import decimal
+import os
+import pickle
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(1, str(Path(__file__).parent.parent.parent.parent))
+
+import raillabel
+
+
+@pytest.fixture
+def frame():
+    object = raillabel.format.Object(
+        uid="b40ba3ad-0327-46ff-9c28-2506cfd6d934", name="person_0000", type="person"
+    )
+    num = raillabel.format.Num(uid="78f0ad89-2750-4a30-9d66-44c9da73a714", name="test", val=1)
+
+    frame = raillabel.format.Frame(uid=0)
+    frame.object_data[object.uid] = raillabel.format.ObjectData(object=object)
+    frame.object_data[object.uid].annotations[num.uid] = num
+
+    return frame
+
+
+def test_eq(frame):
+    frame_copy = pickle.loads(pickle.dumps(frame, -1))
+
+    assert frame == frame_copy
+    assert frame != raillabel.format.Frame(uid=1)
+    assert frame != "not a frame"
+
+
+def test_eq_compares_all_fields(frame):
+    changed_values = {
+        "uid": 1,
+        "timestamp": decimal.Decimal("1632321743.134149"),
+        "sensors": {"lidar": None},
+        "data": {"test": None},
+        "object_data": {},
+    }
+
+    assert [f.name for f in fields(frame) if f.compare] == list(changed_values)
+
+    for field_name, value in changed_values.items():
+        frame_copy = pickle.loads(pickle.dumps(frame, -1))
+        setattr(frame_copy, field_name, value)
+
+        assert frame != frame_copy
+
+
+def test_eq_uid_first():
+    class Uncomparable:
+        def __eq__(self, other):
+            raise AssertionError("compared although the uids differ")
+
+    frame_a = raillabel.format.Frame(uid=0, data={"test": Uncomparable()})
+    frame_b = raillabel.format.Frame(uid=1, data={"test": Uncomparable()})
+
+    assert frame_a != frame_b
+
+
+def test_asdict_frame_data_only():
+    num = raillabel.format.Num(uid="78f0ad89-2750-4a30-9d66-44c9da73a714", name="test", val=1)
+    frame = raillabel.format.Frame(uid=0, data={num.name: num})
+
+    assert frame.asdict() == {"frame_properties": {"frame_data": {"num": [num.asdict()]}}}
+    assert raillabel.format.Frame(uid=0).asdict() == {}
+
+
+def test_annotations_in_place_changes(frame):
+    object_data = frame.object_data["b40ba3ad-0327-46ff-9c28-2506cfd6d934"]
+    num = raillabel.format.Num(uid="4bb95df7-a051-48a9-b77e-72f27ca43f64", name="test", val=2)
+
+    assert list(frame.annotations) == ["78f0ad89-2750-4a30-9d66-44c9da73a714"]
+
+    object_data.annotations[num.uid] = num
+    assert list(frame.annotations) == [
+        "78f0ad89-2750-4a30-9d66-44c9da73a714",
+        "4bb95df7-a051-48a9-b77e-72f27ca43f64",
+    ]
+
+    del frame.object_data["b40ba3ad-0327-46ff-9c28-2506cfd6d934"]
+    assert frame.annotations == {}
+
+
+def test_no_copy_of_passed_dicts():
+    object = raillabel.format.Object(
+        uid="b40ba3ad-0327-46ff-9c28-2506cfd6d934", name="person_0000", type="person"
+    )
+    object_data_dict = {}
+    annotations_dict = {}
+
+    frame = raillabel.format.Frame(uid=0, object_data=object_data_dict)
+    object_data = raillabel.format.ObjectData(object=object, annotations=annotations_dict)
+
+    assert frame.object_data is object_data_dict
+    assert object_data.annotations is annotations_dict
+
+
+def test_annotations_multiple_objects(frame):
+    object = raillabel.format.Object(
+        uid="22dedd49-6dcb-413b-87ef-00ccfb532e98", name="train_0000", type="train"
+    )
+    num = raillabel.format.Num(uid="4bb95df7-a051-48a9-b77e-72f27ca43f64", name="test", val=2)
+
+    frame.object_data[object.uid] = raillabel.format.ObjectData(object=object)
+    frame.object_data[object.uid].annotations[num.uid] = num
+
+    assert list(frame.annotations) == [
+        "78f0ad89-2750-4a30-9d66-44c9da73a714",
+        "4bb95df7-a051-48a9-b77e-72f27ca43f64",
+    ]
+    assert frame.annotations["4bb95df7-a051-48a9-b77e-72f27ca43f64"] is num
+    assert len(frame.annotations) == 2
+
+
+# Executes the test if the file is called
+if __name__ == "__main__":
+    os.system("clear")
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear"])
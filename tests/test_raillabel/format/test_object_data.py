@@ -0,0 +1,70 @@
+# Copyright DB Netz AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(1, str(Path(__file__).parent.parent.parent.parent))
+
+import raillabel
+
+
+@pytest.fixture
+def object_data():
+    object = raillabel.format.Object(
+        uid="b40ba3ad-0327-46ff-9c28-2506cfd6d934", name="person_0000", type="person"
+    )
+    return raillabel.format.ObjectData(object=object)
+
+
+def test_asdict_subclass(object_data):
+    @dataclass
+    class Poly3dSubclass(raillabel.format.Poly3d):
+        pass
+
+    poly3d = Poly3dSubclass(
+        uid="14f58fb0-add7-4ed9-85b3-74615986d854",
+        name="lidar",
+        points=[raillabel.format.Point3d(9, 8, 7)],
+        closed=False,
+    )
+    object_data.annotations[poly3d.uid] = poly3d
+
+    assert object_data.poly3ds == {poly3d.uid: poly3d}
+    assert object_data.asdict() == {"object_data": {"poly3d": [poly3d.asdict()]}}
+
+
+def test_asdict_num(object_data):
+    num = raillabel.format.Num(uid="78f0ad89-2750-4a30-9d66-44c9da73a714", name="test", val=1)
+    object_data.annotations[num.uid] = num
+
+    assert object_data.asdict() == {"object_data": {"num": [num.asdict()]}}
+
+
+def test_asdict_unsupported_type(object_data):
+    @dataclass
+    class Unsupported(raillabel.format._annotation._Annotation):
+        _REQ_FIELDS = []
+
+        def asdict(self):
+            return {}
+
+        @classmethod
+        def fromdict(self, data_dict, sensors):
+            return self(uid=data_dict["uid"], name=data_dict["name"]), []
+
+    unsupported = Unsupported(uid="14f58fb0-add7-4ed9-85b3-74615986d854", name="test")
+    object_data.annotations[unsupported.uid] = unsupported
+
+    with pytest.raises(TypeError):
+        object_data.asdict()
+
+
+# Executes the test if the file is called
+if __name__ == "__main__":
+    os.system("clear")
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear"])
@@ -0,0 +1,32 @@
+# Copyright DB Netz AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(1, str(Path(__file__).parent.parent.parent.parent))
+
+import raillabel
+
+
+def test_points_incomplete():
+    with pytest.raises(ValueError):
+        raillabel.format.Poly2d.fromdict(
+            {
+                "uid": "14f58fb0-add7-4ed9-85b3-74615986d854",
+                "name": "rgb",
+                "closed": False,
+                "mode": "MODE_POLY2D_ABSOLUTE",
+                "val": [1, 2, 3],
+            },
+            {},
+        )
+
+
+# Executes the test if the file is called
+if __name__ == "__main__":
+    os.system("clear")
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear"])
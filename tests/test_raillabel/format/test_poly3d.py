@@ -0,0 +1,69 @@
+# Copyright DB Netz AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(1, str(Path(__file__).parent.parent.parent.parent))
+
+import raillabel
+
+
+def test_points_from_list():
+    poly3d = raillabel.format.Poly3d(
+        uid="14f58fb0-add7-4ed9-85b3-74615986d854",
+        name="lidar",
+        points=[raillabel.format.Point3d(9, 8, 7), raillabel.format.Point3d(6, 5, 4)],
+        closed=False,
+    )
+
+    assert poly3d.asdict()["val"] == [9.0, 8.0, 7.0, 6.0, 5.0, 4.0]
+
+
+def test_points_modification():
+    poly3d, _ = raillabel.format.Poly3d.fromdict(
+        {
+            "uid": "14f58fb0-add7-4ed9-85b3-74615986d854",
+            "name": "lidar",
+            "closed": 0,
+            "val": [9, 8, 7, 6, 5, 4, 3, 2, 1],
+        },
+        {},
+    )
+
+    assert poly3d.closed is False
+    assert poly3d.asdict()["closed"] is False
+
+    assert isinstance(poly3d.points, list)
+    assert poly3d.points[0].x == 9 and type(poly3d.points[0].x) is int
+
+    for point in poly3d.points:
+        point.x += 1
+    poly3d.points[0].z = 0
+    poly3d.points.append(raillabel.format.Point3d(0, 0, 0))
+
+    assert poly3d.asdict()["val"] == [10.0, 8.0, 0.0, 7.0, 5.0, 4.0, 4.0, 2.0, 1.0, 0.0, 0.0, 0.0]
+    assert poly3d == pickle.loads(pickle.dumps(poly3d, -1))
+
+
+def test_points_incomplete():
+    with pytest.raises(ValueError):
+        raillabel.format.Poly3d.fromdict(
+            {
+                "uid": "14f58fb0-add7-4ed9-85b3-74615986d854",
+                "name": "lidar",
+                "closed": False,
+                "val": [1, 2, 3, 4],
+            },
+            {},
+        )
+
+
+# Executes the test if the file is called
+if __name__ == "__main__":
+    os.system("clear")
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear"])